@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List, Tuple
 
@@ -6,6 +7,22 @@ import numpy as np
 import pandas as pd
 
 
+@lru_cache(maxsize=8)
+def _yticks(num_yticks: int) -> Tuple[float, ...]:
+    """Returns the values of ``num_yticks`` ticks spaced evenly between
+    0 and 1, caching the result across calls to PartisanPlot.draw().
+    The values are returned as a tuple, so that the cached result cannot
+    be changed in place through the axes it is set on.
+
+    Args:
+        num_yticks (int): number of ticks on the y-axis
+
+    Returns:
+        (Tuple[float, ...]): The values of the ticks on the y-axis
+    """
+    return tuple(np.linspace(0, 1, num_yticks))
+
+
 class PartisanPlot:
     default_draw_values = ['k', 200, '-', 0.2, 0.6, 11]
 
@@ -34,35 +51,33 @@ class PartisanPlot:
         """
         with open(house_data_path, 'r', errors='ignore') as \
                 read_house_data:
-            self.house_data = pd.read_csv(read_house_data)
+            # only the columns used by draw() are read, with compact
+            # dtypes; state_po and party are stored as categoricals, so
+            # that draw() compares integer codes instead of strings
+            self.house_data = pd.read_csv(
+                read_house_data,
+                usecols=['year', 'state_po', 'district', 'party',
+                         'candidatevotes', 'totalvotes'],
+                dtype={'year': 'int16', 'district': 'int16',
+                       'state_po': 'category', 'party': 'category',
+                       'candidatevotes': 'int32', 'totalvotes': 'int32'})
+        # a sorted (state_po, year) index lets draw() slice out a state's
+        # rows by binary search instead of masking the whole table
+        self.house_data = self.house_data.set_index(
+            ['state_po', 'year']).sort_index()
         with open(num_districts_path, 'r', errors='ignore') as \
                 read_states:
-            self.num_districts = pd.read_csv(read_states, header=None,
-                                             sep=' ', index_col=0,
-                                             squeeze=True)
+            self.num_districts = pd.read_csv(
+                read_states, header=None, sep=' ',
+                index_col=0).squeeze('columns')
         with open(years_path, 'r', errors='ignore') as read_years:
-            self.years = pd.read_csv(read_years, header=None,
-                                     squeeze=True)
+            self.years = pd.read_csv(
+                read_years, header=None).squeeze('columns')
         with open(colors_path, 'r', errors='ignore') as read_colors:
-            self.colors = pd.read_csv(read_colors, header=None,
-                                      squeeze=True)
+            self.colors = pd.read_csv(
+                read_colors, header=None).squeeze('columns')
             self.colors.index = self.years
 
-    def drop_columns(self, dropped_columns_path: Path):
-        """Drops columns from self.house_data, as indicated in the CSV
-        file that dropped_columns_path points to.
-
-        Args:
-            dropped_columns_path (Path): Pathlib path to a CSV file
-                containing row-separated strings, representing
-                indices of DataFrame columns that will be dropped.
-        """
-        with open(dropped_columns_path, 'r', errors='ignore') as \
-                read_dropped_columns:
-            dropped_columns = pd.read_csv(
-                read_dropped_columns, header=None, squeeze=True)
-            self.house_data.drop(dropped_columns, inplace=True, axis=1)
-
     def draw(self,
              state: str,
              figsize: Tuple[int,
@@ -106,6 +121,8 @@ class PartisanPlot:
                                                        stepalpha,
                                                        num_yticks])
 
+        num_districts = int(self.num_districts[state])
+
         fig, axes = plt.subplots(figsize=figsize)
         axes.set_xlabel(
             'Average Democratic Vote Margin in US House Races '
@@ -114,75 +131,111 @@ class PartisanPlot:
 
         # the values of the ticks on the y axis are spaced evenly based
         # on num_yticks
-        yticks = np.linspace(0, 1, num_yticks)
-        axes.set_yticks(yticks)
+        axes.set_yticks(_yticks(num_yticks))
         axes.grid(
             color=axescolor,
             linestyle=axeslinestyle,
             linewidth=axeslinewidth)
 
-        extrema = pd.Series((-1, 1), index=(0, self.num_districts))
-
-        axes.plot([-1, 1], [0.5, 0.5], linewidth=3, color='k')
-        axes.plot([0, 0], [0, 1], linewidth=3, color='k')
-
-        for year in self.years:
-            # only use the vote shares of Republican and Democratic
-            # candidates, in case minor party or independent candidates
-            # run in any of the studied elections
-            major_party_candidates = self.house_data[
-                (self.house_data['year'] == year) &
-                (self.house_data['state_po'] == state) &
-                ((self.house_data['party'] == 'republican') |
-                 (self.house_data['party'] == 'democrat'))]
-            vote_share = pd.DataFrame(
-                np.zeros((self.num_districts[state], 2)),
-                columns=['democrat', 'republican'])
-            vote_share.index += 1
-            dem_votes = rep_votes = 0
-
-            # convert total vote for all candidates to Democratic vote
-            # share, only accounting for two-party votes
-            for index, candidate in major_party_candidates.iterrows():
-                vote_share.loc[
-                    candidate['district'], candidate['party']] += \
-                    (candidate['candidatevotes'] / candidate[
-                        'totalvotes'])
-                if candidate['party'] == 'democrat':
-                    dem_votes += candidate['candidatevotes']
-                else:
-                    rep_votes += candidate['candidatevotes']
+        axes.axhline(0.5, linewidth=3, color='k')
+        axes.axvline(0, linewidth=3, color='k')
+
+        # only use the vote shares of Republican and Democratic
+        # candidates, in case minor party or independent candidates run
+        # in any of the studied elections
+        parties = ['democrat', 'republican']
+        state_data = self.house_data.loc[state]
+        state_data = state_data[
+            state_data['party'].isin(parties) &
+            state_data.index.isin(self.years)]
+
+        # the vote shares are laid out by district - 1, so districts in
+        # the drawn years that fall outside 1 to num_districts (such as
+        # at-large seats, which are numbered 0) are rejected
+        districts = state_data['district']
+        invalid_districts = districts[
+            (districts < 1) | (districts > num_districts)]
+        if not invalid_districts.empty:
+            raise ValueError(
+                f"{state} has districts outside 1 to {num_districts}: "
+                f"{sorted(set(invalid_districts.tolist()))}")
+
+        # an uncontested candidate may be recorded with no votes at all
+        # (e.g. FL 2016 district 24) and is given the district's whole
+        # vote share; a district where such a candidate has a
+        # major-party opponent cannot be resolved and is rejected
+        no_votes = state_data['totalvotes'] == 0
+        num_candidates = state_data.groupby(
+            ['year', 'district'])['district'].transform('size')
+        contested_no_votes = state_data[no_votes & (num_candidates > 1)]
+        if not contested_no_votes.empty:
+            year_districts = sorted(set(zip(
+                contested_no_votes.index.tolist(),
+                contested_no_votes['district'].tolist())))
+            raise ValueError(
+                f"{state} has contested districts with no recorded "
+                f"votes (year, district): {year_districts}")
+
+        # convert total vote for all candidates to Democratic vote share,
+        # only accounting for two-party votes, for every year at once
+        shares = state_data.assign(
+            share=(state_data['candidatevotes'] /
+                   state_data['totalvotes']).where(~no_votes, 1.0))
+        vote_shares = shares.groupby(
+            ['year', 'district', 'party'], observed=True)['share'].sum()
+        vote_shares = vote_shares.unstack('party', fill_value=0.0).reindex(
+            columns=parties, fill_value=0.0)
+        party_votes = state_data.groupby(
+            ['year', 'party'], observed=True)['candidatevotes'].sum()
+        party_votes = party_votes.unstack('party', fill_value=0).reindex(
+            columns=parties, fill_value=0)
+
+        # the y values of the step graph depend only on the number of
+        # districts, so they are shared by every year
+        seats_won = np.empty(num_districts + 2)
+        seats_won[:-1] = np.arange(num_districts + 1)
+        seats_won[-1] = num_districts
+        percent_seats_won = seats_won / num_districts
+
+        # lay the vote shares out as one row of districts per year, in
+        # float32 arrays indexed by district - 1
+        vote_shares = vote_shares.reindex(
+            pd.MultiIndex.from_product(
+                [self.years, range(1, num_districts + 1)]),
+            fill_value=0.0)
+        dem_shares = vote_shares['democrat'].to_numpy(
+            dtype=np.float32).reshape(-1, num_districts)
+        rep_shares = vote_shares['republican'].to_numpy(
+            dtype=np.float32).reshape(-1, num_districts)
+
+        for year, dem_share, rep_share in zip(
+                self.years, dem_shares, rep_shares):
+            dem_votes, rep_votes = party_votes.loc[year]
 
             actual_margin = (dem_votes - rep_votes) / (
                 dem_votes + rep_votes)
-            extrapolated_margin = vote_share.loc[:, 'republican'] - \
-                vote_share.loc[:, 'democrat']
-            extrapolated_margin += actual_margin
-            extrapolated_margin = extrapolated_margin.append(
-                extrema).clip(-1, 1)
-            extrapolated_margin.sort_values(inplace=True)
-
-            dem_seats = (
-                vote_share['democrat'] >= vote_share[
-                    'republican']).value_counts()[True]
-
-            seats_won = [seat for seat in range(
-                self.num_districts[state] + 1)] + [
-                self.num_districts[state]]
-            percent_seats_won = [seat / self.num_districts[state]
-                                 for seat in seats_won]
-
-            for seats, margin in enumerate(
-                    list(extrapolated_margin.values)):
-                partisan_bias = (seats - 1) / self.num_districts[
-                    state] - 0.5
-                if margin >= 0:
-                    break
+            # the extrapolated margins are bounded by the -1 and 1
+            # extrema of the step graph
+            extrapolated_margin = np.empty(num_districts + 2)
+            extrapolated_margin[0] = -1.0
+            extrapolated_margin[-1] = 1.0
+            extrapolated_margin[1:-1] = (
+                rep_share - dem_share) + actual_margin
+            np.clip(extrapolated_margin, -1, 1, out=extrapolated_margin)
+            extrapolated_margin.sort()
+
+            dem_seats = int(np.sum(dem_share >= rep_share))
+
+            # the margins are sorted, so the first non-negative margin
+            # marks the number of seats won at a tied two-party vote
+            seats = int(np.searchsorted(
+                extrapolated_margin, 0.0, side='left'))
+            partisan_bias = (seats - 1) / num_districts - 0.5
 
             # use the step function to graph the Democratic share of
             # seats as total Democratic vote margin changes, per state
             axes.step(
-                extrapolated_margin.values,
+                extrapolated_margin,
                 percent_seats_won,
                 alpha=stepalpha,
                 color=self.colors[year],
@@ -192,10 +245,10 @@ class PartisanPlot:
                 linewidth=3,
                 where='post')
             axes.scatter(actual_margin,
-                         dem_seats / self.num_districts[state],
+                         dem_seats / num_districts,
                          s=dotsize,
                          color=self.colors[year])
-            axes.legend()
+        axes.legend()
 
     def __draw_default_parameters(self, default_parameters: List[Any]):
         """Assigns default parameters for draw(), because default
@@ -212,6 +265,7 @@ class PartisanPlot:
         return default_parameters
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def sign(num: int) -> str:
         """Adds positive sign in front of ``num``, if ``num`` is a
         positive number